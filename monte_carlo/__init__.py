@@ -1 +1,2 @@
-from .monte_carlo import Die, Game, Analyzer
\ No newline at end of file
+from .monte_carlo import Die, Game, Analyzer, MonteCarlo
+from ._random import rng, seed, spawn
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""
+Row-wise kernels behind the Analyzer statistics.
+
+Every kernel takes a 2D array of integer face codes with one row per roll.
+They are compiled with Numba (parallel over rolls) when it is installed and
+the array has at least _NUMBA_MIN_ROWS rows; otherwise the equivalent
+vectorized NumPy versions are used, with numexpr for the jackpot scan and
+the compiled _analyzer_c sort-and-pack kernel when those are available. The
+NumPy versions are always defined (as _np_*) so they can be checked against
+the Numba ones.
+"""
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    from ._analyzer_c import sort_and_pack
+except ImportError:
+    sort_and_pack = None
+
+# Rows per block in the NumPy/numexpr jackpot scan, keeping temporaries cache-sized
+_TILE_ROWS = 1 << 16
+
+# Smaller arrays use the NumPy kernels, as compiling a Numba kernel costs more than it saves on them
+_NUMBA_MIN_ROWS = 1 << 16
+
+
+def count_dtype(n_cols):
+    """
+    Returns the narrowest unsigned dtype that can hold a per-row count of up to n_cols.
+    """
+    if n_cols <= np.iinfo(np.uint8).max:
+        return np.uint8
+    if n_cols <= np.iinfo(np.uint16).max:
+        return np.uint16
+    return np.uint32
+
+
+def _np_jackpot_count(codes):
+    """
+    Counts the rows whose codes are all equal, one block of rows at a time.
+    """
+    total = 0
+    for start in range(0, codes.shape[0], _TILE_ROWS):
+        tile = codes[start:start + _TILE_ROWS]
+        first = tile[:, :1]
+        if numexpr is not None:
+            # Compare and reduce in one numexpr pass, with no boolean temporary
+            mismatches = numexpr.evaluate('sum(where(tile == first, 0, 1), axis=1)')
+            total += int(np.count_nonzero(mismatches == 0))
+        else:
+            total += int(np.count_nonzero(np.all(tile == first, axis=1)))
+    return total
+
+
+def _np_row_histogram(codes, n_faces, dtype):
+    """
+    Counts each code per row into an (n_rows, n_faces) array of the given dtype.
+    """
+    n_rows = codes.shape[0]
+    counts = np.zeros((n_rows, n_faces), dtype=dtype)
+    np.add.at(counts, (np.arange(n_rows)[:, None], codes), 1)
+    return counts
+
+
+def _np_sort_rows(codes, pack):
+    """
+    Sorts each row ascending into a new array.
+
+    Returns the sorted rows and their packed keys when pack is set (else empty).
+    """
+    if pack and sort_and_pack is not None:
+        # Sorting networks in C beat np.sort's per-row dispatch on these short rows
+        sorted_rows = np.array(codes, dtype=np.int32, order='C')
+        keys = np.empty(codes.shape[0], dtype=np.uint64)
+        sort_and_pack(sorted_rows, keys)
+    else:
+        sorted_rows = np.sort(codes, axis=1)
+        keys = _np_pack_rows_u64(sorted_rows) if pack else np.empty(0, dtype=np.uint64)
+    return sorted_rows, keys
+
+
+def _np_analyze_rows(codes, n_faces, pack, dtype):
+    """
+    Computes the per-row statistics over the codes.
+
+    Returns the jackpot count, the (n_rows, n_faces) face counts (of the given
+    dtype), the rows sorted ascending, and their packed keys when pack is set
+    (else empty).
+    """
+    counts = _np_row_histogram(codes, n_faces, dtype)
+    sorted_rows, keys = _np_sort_rows(codes, pack)
+    # A row is a jackpot when its smallest and largest codes match
+    jackpots = int(np.count_nonzero(sorted_rows[:, 0] == sorted_rows[:, -1]))
+    return jackpots, counts, sorted_rows, keys
+
+
+def _np_pack_rows_u64(codes):
+    """
+    Packs each row of at most 8 codes below 256 into one uint64 key, first column most significant.
+    """
+    shifts = _byte_shifts(codes.shape[1])
+    return np.bitwise_or.reduce(codes.astype(np.uint64) << shifts, axis=1)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _nb_jackpot_count(codes):
+        """
+        Counts the rows whose codes are all equal.
+        """
+        n_rows, n_cols = codes.shape
+        total = 0
+        for i in prange(n_rows):
+            hit = 1
+            for j in range(1, n_cols):
+                if codes[i, j] != codes[i, 0]:
+                    hit = 0
+                    break
+            total += hit
+        return total
+
+    @njit(parallel=True, cache=True)
+    def _nb_row_histogram(codes, n_faces, dtype):
+        """
+        Counts each code per row into an (n_rows, n_faces) array of the given dtype.
+        """
+        n_rows, n_cols = codes.shape
+        counts = np.zeros((n_rows, n_faces), dtype=dtype)
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                counts[i, codes[i, j]] += 1
+        return counts
+
+    @njit(parallel=True, cache=True)
+    def _nb_sort_rows(codes, pack):
+        """
+        Sorts each row ascending into a new array.
+
+        Returns the sorted rows and their packed keys when pack is set (else empty).
+        """
+        n_rows, n_cols = codes.shape
+        sorted_rows = np.empty((n_rows, n_cols), dtype=codes.dtype)
+        keys = np.empty(n_rows if pack else 0, dtype=np.uint64)
+        for i in prange(n_rows):
+            # Insertion sort, as rows are only a few dice wide
+            for j in range(n_cols):
+                value = codes[i, j]
+                k = j - 1
+                while k >= 0 and sorted_rows[i, k] > value:
+                    sorted_rows[i, k + 1] = sorted_rows[i, k]
+                    k -= 1
+                sorted_rows[i, k + 1] = value
+            if pack:
+                key = np.uint64(0)
+                for j in range(n_cols):
+                    key = (key << np.uint64(8)) | np.uint64(sorted_rows[i, j])
+                keys[i] = key
+        return sorted_rows, keys
+
+    @njit(parallel=True, cache=True)
+    def _nb_analyze_rows(codes, n_faces, pack, dtype):
+        """
+        Computes the per-row statistics in a single pass over the codes.
+
+        Returns the jackpot count, the (n_rows, n_faces) face counts (of the given
+        dtype), the rows sorted ascending, and their packed keys when pack is set
+        (else empty).
+        """
+        n_rows, n_cols = codes.shape
+        counts = np.zeros((n_rows, n_faces), dtype=dtype)
+        sorted_rows = np.empty((n_rows, n_cols), dtype=codes.dtype)
+        keys = np.empty(n_rows if pack else 0, dtype=np.uint64)
+        jackpots = 0
+        for i in prange(n_rows):
+            hit = 1
+            for j in range(n_cols):
+                value = codes[i, j]
+                if value != codes[i, 0]:
+                    hit = 0
+                counts[i, value] += 1
+                # Insertion sort, as rows are only a few dice wide
+                k = j - 1
+                while k >= 0 and sorted_rows[i, k] > value:
+                    sorted_rows[i, k + 1] = sorted_rows[i, k]
+                    k -= 1
+                sorted_rows[i, k + 1] = value
+            jackpots += hit
+            if pack:
+                key = np.uint64(0)
+                for j in range(n_cols):
+                    key = (key << np.uint64(8)) | np.uint64(sorted_rows[i, j])
+                keys[i] = key
+        return jackpots, counts, sorted_rows, keys
+
+    @njit(parallel=True, cache=True)
+    def _nb_pack_rows_u64(codes):
+        """
+        Packs each row of at most 8 codes below 256 into one uint64 key, first column most significant.
+        """
+        n_rows, n_cols = codes.shape
+        keys = np.empty(n_rows, dtype=np.uint64)
+        for i in prange(n_rows):
+            key = np.uint64(0)
+            for j in range(n_cols):
+                key = (key << np.uint64(8)) | np.uint64(codes[i, j])
+            keys[i] = key
+        return keys
+
+    def _by_rows(nb_kernel, np_kernel):
+        """
+        Wraps a Numba kernel to call its NumPy version on arrays with fewer than _NUMBA_MIN_ROWS rows.
+        """
+        @functools.wraps(np_kernel)
+        def kernel(codes, *args):
+            if codes.shape[0] < _NUMBA_MIN_ROWS:
+                return np_kernel(codes, *args)
+            return nb_kernel(codes, *args)
+        return kernel
+
+    jackpot_count = _by_rows(_nb_jackpot_count, _np_jackpot_count)
+    row_histogram = _by_rows(_nb_row_histogram, _np_row_histogram)
+    sort_rows = _by_rows(_nb_sort_rows, _np_sort_rows)
+    analyze_rows = _by_rows(_nb_analyze_rows, _np_analyze_rows)
+    pack_rows_u64 = _by_rows(_nb_pack_rows_u64, _np_pack_rows_u64)
+else:
+    jackpot_count = _np_jackpot_count
+    row_histogram = _np_row_histogram
+    sort_rows = _np_sort_rows
+    analyze_rows = _np_analyze_rows
+    pack_rows_u64 = _np_pack_rows_u64
+
+
+def unpack_rows_u64(keys, n_cols):
+    """
+    Reverses pack_rows_u64, returning an (n_keys, n_cols) array of codes.
+    """
+    return ((keys[:, None] >> _byte_shifts(n_cols)) & np.uint64(0xFF)).astype(np.intp)
+
+
+def _byte_shifts(n_cols):
+    return np.arange(n_cols - 1, -1, -1, dtype=np.uint64) * np.uint64(8)
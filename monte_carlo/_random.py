@@ -0,0 +1,31 @@
+"""
+The random number generator shared by every Die and Game in the package.
+"""
+import numpy as np
+
+# The seed sequence behind the shared generator, which spawn() derives child generators from
+_seed_seq = np.random.SeedSequence()
+rng = np.random.default_rng(_seed_seq)
+
+def seed(seed=None):
+    """
+    Reseeds the shared generator in place.
+    
+    Parameters:
+    seed: An int, a sequence of ints or an np.random.SeedSequence. Defaults to fresh OS entropy.
+    """
+    global _seed_seq
+    _seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    rng.bit_generator.state = np.random.default_rng(_seed_seq).bit_generator.state
+
+def spawn(n_children):
+    """
+    Spawns independent generators from the shared generator's seed, e.g. for parallel games.
+    
+    Parameters:
+    n_children (int): The number of generators to spawn.
+    
+    Returns:
+    list: A list of np.random.Generator objects.
+    """
+    return [np.random.default_rng(child) for child in _seed_seq.spawn(n_children)]
@@ -1,6 +1,36 @@
 import numpy as np
 import pandas as pd
 
+from . import _kernels, _random
+
+# Outcomes are stored as indices into a face table rather than as the faces themselves
+_CODE_DTYPE = np.int32
+
+def _alias_tables(probs):
+    """
+    Builds Walker alias tables for a discrete distribution (Vose's method).
+    
+    Parameters:
+    probs (np.ndarray): Probabilities of each outcome, summing to one.
+    
+    Returns:
+    tuple: The acceptance probability and the alias index of each outcome.
+    """
+    k = len(probs)
+    scaled = probs * k
+    accept = np.ones(k)
+    alias = np.arange(k, dtype=_CODE_DTYPE)
+    small = [i for i in range(k) if scaled[i] < 1.0]
+    large = [i for i in range(k) if scaled[i] >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        accept[s] = scaled[s]
+        alias[s] = l
+        scaled[l] += scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Whatever is left over is 1 up to rounding error and keeps accept = 1
+    return accept, alias
+
 class Die:
     """
     Represents a single die with customizable faces and weights.
@@ -9,25 +39,45 @@ class Die:
     weight of 1.0. Users can modify the weights and roll the die to generate 
     random outcomes based on these weights.
     """
-    def __init__(self, faces: np.ndarray):
+    def __init__(self, faces: np.ndarray, rng: np.random.Generator = None):
         """
         Initializes the Die object with faces and equal weights.
         
         Parameters:
         faces (np.ndarray): A NumPy array of unique face values (strings or numbers).
+        rng (np.random.Generator): The generator used for rolls. Defaults to the package's shared generator.
         
         Raises:
-        TypeError: If `faces` is not a NumPy array.
-        ValueError: If the values in `faces` are not unique.
+        TypeError: If `faces` is not a NumPy array, or has object dtype.
+        ValueError: If `faces` is not one-dimensional or its values are not unique.
         """
         if not isinstance(faces, np.ndarray):
             raise TypeError("Faces must be a NumPy array.")
-        if len(faces) != len(set(faces)):
+        if faces.dtype == object:
+            raise TypeError("Faces must be numbers or strings, not an object array.")
+        if faces.ndim != 1:
+            raise ValueError("Faces must be a one-dimensional array.")
+        if np.unique(faces).size != faces.size:
             raise ValueError("Faces must contain unique values.")
         
-        self._df = pd.DataFrame({
-            'face': faces,
-            'weight': np.ones(len(faces))
+        self._rng = _random.rng if rng is None else rng
+        # A private, read-only copy so later changes to the caller's array cannot affect the die
+        self._faces = np.array(faces)
+        self._faces.flags.writeable = False
+        self._face_to_idx = {face: idx for idx, face in enumerate(self._faces.tolist())}
+        self._weights = np.ones(len(faces))
+        
+        # Probabilities and alias tables are (re)built by the next roll after any weight change
+        self._probs_dirty = True
+
+    @property
+    def _df(self):
+        """
+        Builds the die's faces and weights as a DataFrame indexed by face.
+        """
+        return pd.DataFrame({
+            'face': self._faces,
+            'weight': self._weights
         }).set_index('face')
 
     def change_weight(self, face, new_weight):
@@ -42,12 +92,14 @@ class Die:
         IndexError: If the face value is not found in the die faces.
         TypeError: If the new weight is not a non-negative number.
         """
-        if face not in self._df.index:
+        idx = self._face_to_idx.get(face)
+        if idx is None:
             raise IndexError("Face value not found in die faces.")
         if not isinstance(new_weight, (int, float)) or new_weight < 0:
             raise TypeError("Weight must be a non-negative number.")
         
-        self._df.at[face, 'weight'] = new_weight
+        self._weights[idx] = new_weight
+        self._probs_dirty = True
 
     def roll(self, num_rolls=1):
         """
@@ -59,7 +111,41 @@ class Die:
         Returns:
         list: A list of outcomes from the rolls.
         """
-        return self._df.sample(n=num_rolls, weights='weight', replace=True).index.tolist()
+        return self._faces[self._sample(num_rolls)].tolist()
+
+    def _sample(self, size, rng=None):
+        """
+        Draws face codes (indices into the die's faces) according to the current weights.
+        
+        Parameters:
+        size (int or tuple): The shape of the array of outcomes.
+        rng (np.random.Generator): The generator to draw from. Defaults to the die's own.
+        
+        Returns:
+        np.ndarray: An int32 array of face codes with the given shape.
+        
+        Raises:
+        ValueError: If every face has a weight of zero.
+        """
+        if self._probs_dirty:
+            total = self._weights.sum()
+            if total == 0:
+                raise ValueError("At least one face must have a positive weight.")
+            self._probs = self._weights / total
+            # A fair die is sampled uniformly and needs no alias tables
+            self._is_fair = bool(np.all(self._weights == self._weights[0]))
+            if not self._is_fair:
+                self._accept, self._alias = _alias_tables(self._probs)
+            self._probs_dirty = False
+        
+        rng = self._rng if rng is None else rng
+        picks = rng.integers(0, len(self._faces), size=size, dtype=_CODE_DTYPE)
+        if self._is_fair:
+            return picks
+        
+        # Keep the uniformly picked column or take its alias
+        keep = rng.random(size) < self._accept[picks]
+        return np.where(keep, picks, self._alias[picks])
 
     def show(self):
         """
@@ -68,27 +154,100 @@ class Die:
         Returns:
         pd.DataFrame: A copy of the die's faces and weights.
         """
-        return self._df.copy()
+        return self._df
+    
+def _check_dice(dice):
+    """
+    Validates the dice of a Game or MonteCarlo.
+    
+    Outcomes are coded against one shared table of every die's faces, so the faces
+    must keep their values in it: integers and floats can be mixed, numbers and strings cannot.
+    
+    Parameters:
+    dice (list): A list of Die objects.
     
+    Raises:
+    TypeError: If the list does not contain Die objects, or their faces cannot share one face table.
+    ValueError: If the list is empty.
+    """
+    if not all(hasattr(die, 'roll') for die in dice):
+        raise TypeError("All items in the list must be Die objects.")
+    if len(dice) == 0:
+        raise ValueError("At least one die is required.")
+    
+    message = "All dice must have faces of compatible types, e.g. not both numbers and strings."
+    try:
+        faces = np.unique(np.concatenate([die._faces for die in dice]))
+    except TypeError:
+        raise TypeError(message)
+    for die in dice:
+        shared = faces[np.searchsorted(faces, die._faces.astype(faces.dtype))]
+        if shared.tolist() != die._faces.tolist():
+            raise TypeError(message)
+
+def _roll_dice(dice, size, rng):
+    """
+    Rolls every die in a list, with the dice as the last axis of the outcomes.
+    
+    Parameters:
+    dice (list): A list of Die objects.
+    size (tuple): The shape of the outcomes for each die, e.g. (n_rolls,).
+    rng (np.random.Generator): The generator for every die, or None to use each die's own.
+    
+    Returns:
+    tuple: A read-only int32 array of shape size + (len(dice),) holding codes into the
+    sorted array of every face the dice can show, and that array of faces.
+    """
+    # Group dice that share faces, weights and generator so each group is rolled in one draw
+    groups = []
+    for die_idx, die in enumerate(dice):
+        for rep, cols in groups:
+            if rep is die or ((rng is not None or rep._rng is die._rng)
+                              and np.array_equal(rep._faces, die._faces)
+                              and np.array_equal(rep._weights, die._weights)):
+                cols.append(die_idx)
+                break
+        else:
+            groups.append((die, [die_idx]))
+    
+    # Code every outcome against one sorted table of the dice's faces
+    faces = np.unique(np.concatenate([rep._faces for rep, _ in groups]))
+    blocks = []
+    for rep, cols in groups:
+        codes = rep._sample(size + (len(cols),), rng)
+        if not np.array_equal(rep._faces, faces):
+            codes = np.searchsorted(faces, rep._faces).astype(_CODE_DTYPE)[codes]
+        blocks.append(codes)
+    order = np.concatenate([cols for _, cols in groups])
+    
+    # Put the columns back in die order
+    arr = np.concatenate(blocks, axis=-1)[..., np.argsort(order)]
+    arr.flags.writeable = False
+    return arr, faces
+
 class Game:
     """
     Represents a game consisting of rolling one or more dice (Die objects) one or more times.
     """
-    def __init__(self, dice: list):
+    def __init__(self, dice: list, rng: np.random.Generator = None):
         """
         Initializes the Game object with a list of Die objects.
         
         Parameters:
         dice (list): A list of Die objects.
+        rng (np.random.Generator): The generator used for every die in the game. Defaults to each die's own.
         
         Raises:
-        TypeError: If the list does not contain Die objects.
+        TypeError: If the list does not contain Die objects, or their faces cannot share one face table.
+        ValueError: If the list is empty.
         """
-        if not all(hasattr(die, 'roll') for die in dice):
-            raise TypeError("All items in the list must be Die objects.")
+        _check_dice(dice)
         
         self.dice = dice
-        self._play_results = None
+        self._rng = rng
+        self._arr = None
+        self._faces = None
+        self._n_rolls = 0
 
     def play(self, n_rolls: int):
         """
@@ -98,17 +257,15 @@ class Game:
         n_rolls (int): The number of times to roll the dice.
         
         Saves:
-        A private data frame with the results of the rolls in wide format.
+        A private (read-only) array with the results of the rolls in wide format, as
+        int32 codes into a private sorted array of every face the dice can show.
         """
         if n_rolls <= 0:
             raise ValueError("Number of rolls must be a positive integer.")
         
-        # Roll each die and collect results
-        results = {die_idx: die.roll(n_rolls) for die_idx, die in enumerate(self.dice)}
-        
-        # Create DataFrame in wide format
-        self._play_results = pd.DataFrame(results)
-        self._play_results.index.name = 'Roll'
+        # DataFrames are only built by show()
+        self._arr, self._faces = _roll_dice(self.dice, (n_rolls,), self._rng)
+        self._n_rolls = n_rolls
 
     def show(self, form='wide'):
         """
@@ -123,13 +280,23 @@ class Game:
         Raises:
         ValueError: If the form parameter is not 'wide' or 'narrow'.
         """
-        if self._play_results is None:
+        if self._arr is None:
             raise ValueError("No play results to show. Please play the game first.")
         
         if form == 'wide':
-            return self._play_results.copy()
+            # Decoding the codes already makes a new array, which the frame can own
+            return pd.DataFrame(self._faces[self._arr], copy=False).rename_axis('Roll')
         elif form == 'narrow':
-            return self._play_results.stack().to_frame('Outcome').rename_axis(index=['Roll', 'Die'])
+            # Row-major flattening lists each roll's dice in order; the index codes are
+            # built directly against range levels, so nothing has to be factorized
+            n_dice = self._arr.shape[1]
+            index = pd.MultiIndex(
+                levels=[pd.RangeIndex(self._n_rolls), pd.RangeIndex(n_dice)],
+                codes=[np.repeat(np.arange(self._n_rolls), n_dice), np.tile(np.arange(n_dice), self._n_rolls)],
+                names=['Roll', 'Die'],
+                verify_integrity=False
+            )
+            return pd.DataFrame({'Outcome': self._faces[self._arr.reshape(-1)]}, index=index)
         else:
             raise ValueError("Invalid form. Please choose 'wide' or 'narrow'.")
         
@@ -146,13 +313,34 @@ class Analyzer:
         game (Game): A Game object.
         
         Raises:
-        ValueError: If the input is not a Game object.
+        ValueError: If the input is not a Game object or has not been played.
         """
         if not hasattr(game, 'show'):
             raise ValueError("The input must be a Game object.")
+        if game._arr is None:
+            raise ValueError("No play results to analyze. Please play the game first.")
         
         self.game = game
-        self.results = game.show('wide')
+        
+        # The game's int32 face codes are analyzed directly; faces are only looked up for output
+        self._faces = game._faces
+        self._codes = game._arr
+        
+        # With at most 256 faces and 8 dice, a roll fits in one uint64 key (one face per byte)
+        self._packable = len(self._faces) <= 256 and self._codes.shape[1] <= 8
+        self._count_dtype = _kernels.count_dtype(self._codes.shape[1])
+        
+        # Cached row statistics; each is computed by the cheapest kernel that provides it
+        self._jackpots = None
+        self._counts = None
+        self._sorted = None
+
+    @property
+    def results(self):
+        """
+        The analyzed play results as a wide DataFrame.
+        """
+        return pd.DataFrame(self._faces[self._codes], copy=False).rename_axis('Roll')
 
     def jackpot(self):
         """
@@ -161,7 +349,9 @@ class Analyzer:
         Returns:
         int: The number of jackpots.
         """
-        return int((self.results.nunique(axis=1) == 1).sum())
+        if self._jackpots is None:
+            self._jackpots = int(_kernels.jackpot_count(self._codes))
+        return self._jackpots
 
     def face_counts_per_roll(self):
         """
@@ -170,7 +360,15 @@ class Analyzer:
         Returns:
         pd.DataFrame: A DataFrame with roll numbers as rows, face values as columns, and counts as values.
         """
-        return self.results.apply(pd.Series.value_counts, axis=1).fillna(0).astype(int)
+        if self._counts is None:
+            self._counts = _kernels.row_histogram(self._codes, len(self._faces), self._count_dtype)
+        counts = self._counts
+        rolled = counts.any(axis=0)
+        if not rolled.all():
+            counts = counts[:, rolled]
+        # The narrow cached counts are widened once, into a fresh array the frame can own
+        return pd.DataFrame(counts.astype(np.int64), index=pd.RangeIndex(len(counts), name='Roll'),
+                            columns=self._faces[rolled], copy=False)
 
     def combo_count(self):
         """
@@ -179,13 +377,14 @@ class Analyzer:
         Combinations are order-independent and may contain repetitions.
         
         Returns:
-        pd.DataFrame: A DataFrame with a MultiIndex of distinct combinations and a column for the associated counts.
+        pd.DataFrame: A DataFrame with a MultiIndex of distinct combinations, whose levels 'Face 1'
+        to 'Face n' hold each combination's faces in ascending order, and a column for the associated counts.
         """
-        combos = self.results.apply(lambda row: tuple(sorted(row)), axis=1)
-        combo_counts = combos.value_counts().reset_index()
-        combo_counts.columns = ['Combination', 'Count']
-        combo_counts.set_index('Combination', inplace=True)
-        return combo_counts
+        if self._sorted is None:
+            self._sorted = _kernels.sort_rows(self._codes, self._packable)
+        sorted_codes, keys = self._sorted
+        names = [f'Face {pos + 1}' for pos in range(sorted_codes.shape[1])]
+        return self._count_rows(sorted_codes, names, keys if self._packable else None)
 
     def permutation_count(self):
         """
@@ -194,10 +393,134 @@ class Analyzer:
         Permutations are order-dependent and may contain repetitions.
         
         Returns:
-        pd.DataFrame: A DataFrame with a MultiIndex of distinct permutations and a column for the associated counts.
+        pd.DataFrame: A DataFrame with a MultiIndex of distinct permutations, whose levels 'Die 0'
+        to 'Die n-1' hold the face rolled by each die, and a column for the associated counts.
+        """
+        names = [f'Die {die_idx}' for die_idx in range(self._codes.shape[1])]
+        return self._count_rows(self._codes, names)
+
+    def analyze_all(self):
+        """
+        Computes the jackpots, face counts per roll and combinations together.
+        
+        The underlying statistics come from a single pass over the results, and are
+        cached so later calls to jackpot, face_counts_per_roll and combo_count reuse them.
+        
+        Returns:
+        tuple: The outputs of jackpot, face_counts_per_roll and combo_count, in that order.
+        """
+        if self._jackpots is None or self._counts is None or self._sorted is None:
+            jackpots, counts, sorted_codes, keys = _kernels.analyze_rows(
+                self._codes, len(self._faces), self._packable, self._count_dtype)
+            self._jackpots, self._counts, self._sorted = int(jackpots), counts, (sorted_codes, keys)
+        return self.jackpot(), self.face_counts_per_roll(), self.combo_count()
+
+    def _count_rows(self, codes, names, keys=None):
+        """
+        Counts the distinct rows of an array of face codes.
+        
+        Parameters:
+        codes (np.ndarray): A 2D array of face codes, one row per roll.
+        names (list): The names of the index levels, one per column of codes.
+        keys (np.ndarray): The rows already packed into uint64 keys, if available.
+        
+        Returns:
+        pd.DataFrame: A DataFrame with a MultiIndex of distinct rows (as faces) and a column for the associated counts.
+        """
+        if self._packable:
+            if keys is None:
+                keys = _kernels.pack_rows_u64(codes)
+            keys, counts = np.unique(keys, return_counts=True)
+            rows = _kernels.unpack_rows_u64(keys, codes.shape[1])
+        else:
+            rows, counts = np.unique(codes, axis=0, return_counts=True)
+        
+        # Most frequent rows first, decoding faces once per distinct row
+        order = np.argsort(-counts, kind='stable')
+        rows = self._faces[rows[order]]
+        index = pd.MultiIndex.from_arrays([rows[:, col] for col in range(rows.shape[1])], names=names)
+        return pd.DataFrame({'Count': counts[order]}, index=index)
+
+class MonteCarlo:
+    """
+    Plays many independent games with the same dice at once and summarizes each game.
+    
+    All games are rolled in one batch and every statistic is reduced over the
+    game axis in one vectorized step, instead of creating a Game per simulation.
+    """
+    def __init__(self, dice: list, rng: np.random.Generator = None):
+        """
+        Initializes the MonteCarlo object with a list of Die objects.
+        
+        Parameters:
+        dice (list): A list of Die objects.
+        rng (np.random.Generator): The generator used for every die. Defaults to each die's own.
+        
+        Raises:
+        TypeError: If the list does not contain Die objects, or their faces cannot share one face table.
+        ValueError: If the list is empty.
+        """
+        _check_dice(dice)
+        
+        self.dice = dice
+        self._rng = rng
+        self._arr = None
+        self._faces = None
+
+    def run(self, n_rolls: int, n_games: int):
+        """
+        Plays a number of games, each rolling all dice a specified number of times.
+        
+        Parameters:
+        n_rolls (int): The number of times to roll the dice in each game.
+        n_games (int): The number of games to play.
+        
+        Saves:
+        A private (read-only) array of face codes with shape (n_games, n_rolls, n_dice).
+        """
+        if n_rolls <= 0:
+            raise ValueError("Number of rolls must be a positive integer.")
+        if n_games <= 0:
+            raise ValueError("Number of games must be a positive integer.")
+        
+        self._arr, self._faces = _roll_dice(self.dice, (n_games, n_rolls), self._rng)
+
+    def jackpot(self):
+        """
+        Counts how many jackpots occurred in each game.
+        
+        Returns:
+        pd.Series: The number of jackpots, indexed by game.
+        
+        Raises:
+        ValueError: If the simulation has not been run.
+        """
+        arr = self._results()
+        jackpots = np.all(arr == arr[:, :, :1], axis=2).sum(axis=1)
+        return pd.Series(jackpots, index=pd.RangeIndex(len(arr), name='Game'), name='Jackpots')
+
+    def face_counts(self):
+        """
+        Computes the total count of each face value in each game.
+        
+        Returns:
+        pd.DataFrame: A DataFrame with games as rows, face values as columns, and counts as values.
+        
+        Raises:
+        ValueError: If the simulation has not been run.
+        """
+        arr = self._results()
+        n_games, n_faces = len(arr), len(self._faces)
+        
+        # One bincount over (game, face) pairs flattened into a single index
+        keys = np.arange(n_games)[:, None, None] * n_faces + arr
+        counts = np.bincount(keys.ravel(), minlength=n_games * n_faces).reshape(n_games, n_faces)
+        return pd.DataFrame(counts, index=pd.RangeIndex(n_games, name='Game'), columns=self._faces)
+
+    def _results(self):
+        """
+        Returns the simulation results, checking that the simulation has been run.
         """
-        perms = self.results.apply(lambda row: tuple(row), axis=1)
-        perm_counts = perms.value_counts().reset_index()
-        perm_counts.columns = ['Permutation', 'Count']
-        perm_counts.set_index('Permutation', inplace=True)
-        return perm_counts
\ No newline at end of file
+        if self._arr is None:
+            raise ValueError("No simulation results. Please run the simulation first.")
+        return self._arr
@@ -1,13 +1,29 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+# The C sort-and-pack kernel is optional: without Cython, or if it fails to compile,
+# the package installs without it and the NumPy path is used
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize([
+        Extension('monte_carlo._analyzer_c', ['monte_carlo/_analyzer_c.pyx'], optional=True)
+    ])
 
 setup(
     name='monte_carlo',
     version='0.1',
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         'numpy',
         'pandas',
     ],
+    extras_require={
+        'numba': ['numba'],
+        'numexpr': ['numexpr'],
+    },
     author='Robert Clay Harris',
     author_email='jbm2rt@virginia.edu',
     description='A Monte Carlo Simulator',
@@ -1,7 +1,10 @@
 import unittest
+from collections import Counter
+from unittest import mock
 import numpy as np
 import pandas as pd
-from monte_carlo import Die, Game, Analyzer
+from monte_carlo import Die, Game, Analyzer, MonteCarlo, seed, spawn
+from monte_carlo import _kernels
 
 class TestDie(unittest.TestCase):
     def setUp(self):
@@ -12,6 +15,24 @@ class TestDie(unittest.TestCase):
         # Test that the representation of the die is a DataFrame
         self.assertIsInstance(self.die._df, pd.DataFrame)
 
+    def test_init_invalid_faces(self):
+        # Test that repeated, multi-dimensional and object faces are rejected
+        with self.assertRaises(ValueError):
+            Die(np.array([1, 2, 2]))
+        with self.assertRaises(ValueError):
+            Die(np.array([[1, 2], [3, 4]]))
+        with self.assertRaises(TypeError):
+            Die(np.array([1, 'a', None], dtype=object))
+
+    def test_init_copies_faces(self):
+        faces = np.array([1, 2, 3])
+        die = Die(faces)
+        faces[:] = [7, 8, 9]
+        
+        # Test that the die keeps its own faces when the caller's array changes
+        self.assertTrue(set(die.roll(20)) <= {1, 2, 3})
+        die.change_weight(1, 2.0)
+
     def test_change_weight(self):
         self.die.change_weight(1, 2.0)
         
@@ -24,6 +45,14 @@ class TestDie(unittest.TestCase):
         # Test that the number of results is equal to 10, the number of rolls
         self.assertEqual(len(result), 10)
 
+    def test_roll_weights(self):
+        for face in [1, 2, 3, 5, 6]:
+            self.die.change_weight(face, 0)
+        result = self.die.roll(100)
+        
+        # Test that faces with zero weight are never rolled
+        self.assertEqual(set(result), {4})
+
     def test_show(self):
         df = self.die.show()
         
@@ -44,14 +73,28 @@ class TestGame(unittest.TestCase):
         for die in self.game.dice:
             self.assertIsInstance(die, Die)
 
+
+    def test_init_invalid_dice(self):
+        # Test that an empty list and dice mixing numbers and strings are rejected
+        with self.assertRaises(ValueError):
+            Game([])
+        with self.assertRaises(TypeError):
+            Game([Die(np.array([1, 2])), Die(np.array(['a', 'b']))])
+        
+        # Test that mixed integer and float faces keep their values
+        for faces in [np.array([1, 2], dtype=np.uint8), np.array([3, 4], dtype=np.int8), np.array([1.5, 2.5])]:
+            game = Game([Die(np.array([1, 2])), Die(faces)])
+            game.play(20)
+            self.assertTrue(set(game.show('wide')[1]) <= set(faces.tolist()))
+
     def test_play(self):
         self.game.play(10)
         
-        # Test that the results are a DataFrame
-        self.assertIsInstance(self.game._play_results, pd.DataFrame)
+        # Test that the results are an array
+        self.assertIsInstance(self.game._arr, np.ndarray)
         
-        # Check that the number of rows in the results dataframe is equal to 10, the number of rolls
-        self.assertEqual(len(self.game._play_results), 10)
+        # Check that the results have one row per roll and one column per die
+        self.assertEqual(self.game._arr.shape, (10, 2))
 
     def test_show(self):
         self.game.play(10)
@@ -64,6 +107,44 @@ class TestGame(unittest.TestCase):
         
         # Check that the narrow results output the Roll and Die
         self.assertEqual(df_narrow.index.names, ['Roll', 'Die'])
+        
+        # Check that the narrow results hold the same outcomes as the wide results
+        self.assertTrue(df_narrow['Outcome'].equals(df_wide.stack().rename('Outcome')))
+        
+        # Check that modifying the returned results does not change the game's results
+        df_wide.iloc[0, 0] = 0
+        self.assertNotEqual(self.game.show('wide').iloc[0, 0], 0)
+
+    def test_seed(self):
+        seed(42)
+        self.game.play(10)
+        first = self.game.show('wide')
+        seed(42)
+        self.game.play(10)
+        
+        # Check that reseeding the shared generator reproduces the same results
+        self.assertTrue(first.equals(self.game.show('wide')))
+        
+        # Check that generators spawned after reseeding are reproducible and independent
+        seed(42)
+        first = [gen.random() for gen in spawn(2)]
+        seed(42)
+        second = [gen.random() for gen in spawn(2)]
+        self.assertEqual(first, second)
+        self.assertNotEqual(first[0], first[1])
+        
+        # Check that a game's own generator is used for all of its dice
+        games = [Game(self.dice, rng=np.random.default_rng(7)) for _ in range(2)]
+        for game in games:
+            game.play(10)
+        self.assertTrue(games[0].show('wide').equals(games[1].show('wide')))
+        
+        # Check that dice with their own generators are each rolled from them
+        faces = np.array([1, 2, 3, 4, 5, 6])
+        game = Game([Die(faces, rng=np.random.default_rng(1)), Die(faces, rng=np.random.default_rng(2))])
+        game.play(10)
+        self.assertEqual(game.show('wide')[0].tolist(), Die(faces, rng=np.random.default_rng(1)).roll(10))
+        self.assertEqual(game.show('wide')[1].tolist(), Die(faces, rng=np.random.default_rng(2)).roll(10))
 
 class TestAnalyzer(unittest.TestCase):
     def setUp(self):
@@ -76,6 +157,19 @@ class TestAnalyzer(unittest.TestCase):
         self.game = game
         self.analyzer = Analyzer(game)
 
+    def assert_counts_match(self, game):
+        # Check combo_count and permutation_count against Counters of the (sorted) rolled rows
+        analyzer = Analyzer(game)
+        rows = list(game.show('wide').itertuples(index=False, name=None))
+        combo_counts = analyzer.combo_count()['Count']
+        perm_counts = analyzer.permutation_count()['Count']
+        self.assertEqual(dict(combo_counts), Counter(tuple(sorted(row)) for row in rows))
+        self.assertEqual(dict(perm_counts), Counter(rows))
+        
+        # Check that the most frequent rows come first
+        self.assertTrue(combo_counts.is_monotonic_decreasing)
+        self.assertTrue(perm_counts.is_monotonic_decreasing)
+
     def test_init(self):
         # Check that the input is a Game object
         self.assertTrue(hasattr(self.analyzer.game, 'show'), "The input must be a Game object.")
@@ -112,6 +206,11 @@ class TestAnalyzer(unittest.TestCase):
         
         # Check that the number of combinations is less than or equal to the number of permutations
         self.assertLessEqual(len(combo_counts), len(perm_counts))
+        
+        # Check the counts of a seeded game with three dice
+        game = Game(self.game.dice + self.game.dice[:1], rng=np.random.default_rng(3))
+        game.play(200)
+        self.assert_counts_match(game)
 
     def test_permutation_count(self):
         perm_counts = self.analyzer.permutation_count()
@@ -122,6 +221,166 @@ class TestAnalyzer(unittest.TestCase):
         
         # Check that the number of permutations is greater than or equal to the number of combinations
         self.assertGreaterEqual(len(perm_counts), len(combo_counts))
+        
+        # Check the counts of a seeded game with weighted dice
+        dice = [Die(np.array([1, 2, 3, 4, 5, 6])) for _ in range(2)]
+        dice[0].change_weight(6, 5.0)
+        game = Game(dice, rng=np.random.default_rng(4))
+        game.play(200)
+        self.assert_counts_match(game)
+        
+        # Check that the index levels are named after the dice and the sorted faces
+        self.assertEqual(list(perm_counts.index.names), ['Die 0', 'Die 1'])
+        self.assertEqual(list(combo_counts.index.names), ['Face 1', 'Face 2'])
+
+    def test_analyze_all(self):
+        jackpots, face_counts, combo_counts = self.analyzer.analyze_all()
+        
+        # Check that the fused results match the individual methods
+        self.assertEqual(jackpots, self.analyzer.jackpot())
+        self.assertTrue(face_counts.equals(self.analyzer.face_counts_per_roll()))
+        self.assertTrue(combo_counts.equals(self.analyzer.combo_count()))
+        
+        # Check that every roll is counted in exactly one combination
+        self.assertEqual(combo_counts['Count'].sum(), self.num_rolls)
+
+    def test_unpacked_counts(self):
+        # Check games with too many dice or faces for a roll to be packed into one uint64 key
+        for faces, n_dice in [(np.arange(3), 9), (np.arange(300), 2)]:
+            game = Game([Die(faces) for _ in range(n_dice)], rng=np.random.default_rng(5))
+            game.play(500)
+            analyzer = Analyzer(game)
+            self.assertFalse(analyzer._packable)
+            self.assert_counts_match(game)
+            
+            # Check that the fused results match the counts of the wide results
+            jackpots, face_counts, combo_counts = analyzer.analyze_all()
+            wide = game.show('wide')
+            self.assertEqual(jackpots, int((wide.nunique(axis=1) == 1).sum()))
+            self.assertTrue((face_counts.sum(axis=1) == n_dice).all())
+            self.assertTrue(combo_counts.equals(Analyzer(game).combo_count()))
+
+    def test_letter_faces(self):
+        letters = np.array(list('ABCDEF'))
+        game = Game([Die(letters) for _ in range(3)], rng=np.random.default_rng(6))
+        game.play(200)
+        self.assert_counts_match(game)
+        
+        # Check that face counts are labelled with the letters and count every die
+        face_counts = Analyzer(game).face_counts_per_roll()
+        self.assertTrue(set(face_counts.columns) <= set(letters))
+        self.assertTrue((face_counts.sum(axis=1) == 3).all())
+        self.assertEqual(face_counts.loc[0].to_dict(),
+                         {face: game.show('wide').loc[0].tolist().count(face) for face in face_counts.columns})
+
+class TestMonteCarlo(unittest.TestCase):
+    def setUp(self):
+        faces = np.array([1, 2, 3, 4, 5, 6])
+        self.monte_carlo = MonteCarlo([Die(faces), Die(faces)])
+        self.n_rolls = 10
+        self.n_games = 4
+        self.monte_carlo.run(self.n_rolls, self.n_games)
+
+    def test_run(self):
+        # Check that the results hold every roll of every die in every game
+        self.assertEqual(self.monte_carlo._arr.shape, (self.n_games, self.n_rolls, 2))
+
+    def test_jackpot(self):
+        jackpots = self.monte_carlo.jackpot()
+        
+        # Check that there is one jackpot count per game, each at most the number of rolls
+        self.assertEqual(len(jackpots), self.n_games)
+        self.assertTrue((jackpots <= self.n_rolls).all())
+
+    def test_face_counts(self):
+        face_counts = self.monte_carlo.face_counts()
+        
+        # Check that the result is a DataFrame with one row per game
+        self.assertIsInstance(face_counts, pd.DataFrame)
+        self.assertEqual(len(face_counts), self.n_games)
+        
+        # Check that every roll of every die is counted once
+        self.assertTrue((face_counts.sum(axis=1) == self.n_rolls * 2).all())
+
+class TestKernels(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.n_faces = 6
+        self.codes = rng.integers(0, self.n_faces, size=(1000, 3), dtype=np.int32)
+        self.codes[:50] = self.codes[:50, :1]
+        
+        # Send arrays of any size to the Numba kernels, when Numba is installed
+        self.numba_rows = mock.patch.object(_kernels, '_NUMBA_MIN_ROWS', 0)
+
+    def test_jackpot_count(self):
+        expected = int(np.all(self.codes == self.codes[:, :1], axis=1).sum())
+        
+        # Check the active kernel for small and large arrays, and the NumPy fallback with and without numexpr
+        self.assertEqual(_kernels.jackpot_count(self.codes), expected)
+        with self.numba_rows:
+            self.assertEqual(_kernels.jackpot_count(self.codes), expected)
+        self.assertEqual(_kernels._np_jackpot_count(self.codes), expected)
+        with mock.patch.object(_kernels, 'numexpr', None):
+            self.assertEqual(_kernels._np_jackpot_count(self.codes), expected)
+
+    def test_analyze_rows(self):
+        sorted_rows = np.sort(self.codes, axis=1)
+        expected_counts = np.stack([np.bincount(row, minlength=self.n_faces) for row in self.codes])
+        expected_keys = _kernels._np_pack_rows_u64(sorted_rows)
+        dtype = _kernels.count_dtype(self.codes.shape[1])
+        
+        # Check the active kernel for small and large arrays, and the NumPy fallback with and without the C sort
+        with mock.patch.object(_kernels, 'sort_and_pack', None):
+            results = [_kernels.analyze_rows(self.codes, self.n_faces, True, dtype),
+                       _kernels._np_analyze_rows(self.codes, self.n_faces, True, dtype)]
+        with self.numba_rows:
+            results.append(_kernels.analyze_rows(self.codes, self.n_faces, True, dtype))
+        results.append(_kernels._np_analyze_rows(self.codes, self.n_faces, True, dtype))
+        for jackpots, counts, rows, keys in results:
+            self.assertEqual(jackpots, _kernels._np_jackpot_count(self.codes))
+            np.testing.assert_array_equal(counts, expected_counts)
+            np.testing.assert_array_equal(rows, sorted_rows)
+            np.testing.assert_array_equal(keys, expected_keys)
+            self.assertEqual(counts.dtype, np.uint8)
+        
+        # Check that the standalone histogram and sort kernels agree with the fused one
+        for min_rows in [_kernels._NUMBA_MIN_ROWS, 0]:
+            with mock.patch.object(_kernels, '_NUMBA_MIN_ROWS', min_rows):
+                np.testing.assert_array_equal(_kernels.row_histogram(self.codes, self.n_faces, dtype),
+                                              expected_counts)
+                rows, keys = _kernels.sort_rows(self.codes, True)
+                np.testing.assert_array_equal(rows, sorted_rows)
+                np.testing.assert_array_equal(keys, expected_keys)
+                
+                # Check that no keys are returned when rows are not packed
+                self.assertEqual(_kernels.analyze_rows(self.codes, self.n_faces, False, dtype)[3].size, 0)
+                self.assertEqual(_kernels.sort_rows(self.codes, False)[1].size, 0)
+
+    @unittest.skipIf(_kernels.sort_and_pack is None, "the _analyzer_c extension is not built")
+    def test_sort_and_pack(self):
+        rng = np.random.default_rng(1)
+        for n_cols in range(1, 9):
+            codes = rng.integers(0, 256, size=(500, n_cols), dtype=np.int32)
+            rows = codes.copy()
+            keys = np.empty(len(codes), dtype=np.uint64)
+            _kernels.sort_and_pack(rows, keys)
+            
+            # Check that the sorting network and packing match np.sort and pack_rows_u64
+            np.testing.assert_array_equal(rows, np.sort(codes, axis=1))
+            np.testing.assert_array_equal(keys, _kernels._np_pack_rows_u64(np.sort(codes, axis=1)))
+        
+        # Check that rows too wide to pack are rejected
+        with self.assertRaises(ValueError):
+            _kernels.sort_and_pack(np.zeros((2, 9), dtype=np.int32), np.empty(2, dtype=np.uint64))
+
+    def test_pack_rows_u64(self):
+        keys = _kernels.pack_rows_u64(self.codes)
+        
+        # Check that the active kernel matches the fallback and that keys unpack to the rows
+        np.testing.assert_array_equal(keys, _kernels._np_pack_rows_u64(self.codes))
+        with self.numba_rows:
+            np.testing.assert_array_equal(_kernels.pack_rows_u64(self.codes), keys)
+        np.testing.assert_array_equal(_kernels.unpack_rows_u64(keys, 3), self.codes)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file